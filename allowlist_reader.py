@@ -2,8 +2,20 @@
 
 CircuitPython builds often omit ``csv``, so this uses simple line splitting.
 It looks up a row by the student ID column (default header name ``PIN``).
+
+:func:`load_allowlist_bin` reads the fixed-width ``Allowlist.bin`` compiled
+from the CSV, with no text parsing at all.
 """
 
+import binascii
+import struct
+
+_BIN_HEADER = ">IH"
+_BIN_HEADER_SIZE = 6
+_BIN_RECORD = ">IBB16s"
+_BIN_RECORD_SIZE = 22
+_BIN_NO_BLOCK = 0xFF
+
 
 def lookup_student(
     student_id,
@@ -19,37 +31,139 @@ def lookup_student(
 
     sid = str(student_id).strip()
 
+    # Stream line by line so only one row is in memory, and stop at a match.
     try:
         with open(filename, "r") as f:
-            lines = f.read().splitlines()
+            header = _split_line(f.readline())
+            use_header = False
+            id_idx = 0
+
+            # Detect header presence by column name.
+            if id_column in header:
+                use_header = True
+                id_idx = header.index(id_column)
+            else:
+                f.seek(0)  # treat first line as data
+
+            for raw in f:
+                # Only the ID field is stripped until a row actually matches.
+                if _row_matches(_split_line_fast(raw), sid, id_idx):
+                    return _make_row(header if use_header else None, _split_line(raw))
     except OSError as err:
         print("Allowlist read failed:", err)
+
+    return None
+
+
+def load_allowlist_bin(
+    *,
+    filename: str = "Allowlist.bin",
+    csv_filename: str = "Allowlist.csv",
+):
+    """Read the compiled binary allowlist and return ``{pin: (a, b, name)}``.
+
+    ``pin`` is an int and ``a``/``b`` are ints, or ``None`` where the CSV value
+    was blank. No text is parsed apart from decoding each name. Returns
+    ``None`` if the file is missing or truncated, or if ``csv_filename``
+    exists and its CRC-32 no longer matches the one recorded by
+    ``generate_allowlist.py``, so the caller can fall back to
+    :func:`load_allowlist`.
+    """
+
+    buf = bytearray(_BIN_RECORD_SIZE)
+    students = {}
+    try:
+        with open(filename, "rb") as f:
+            if f.readinto(buf) < _BIN_HEADER_SIZE:
+                print("Allowlist.bin is truncated")
+                return None
+            csv_crc, count = struct.unpack_from(_BIN_HEADER, buf, 0)
+            try:
+                if _file_crc32(csv_filename, buf) != csv_crc:
+                    print("Allowlist.bin is stale; rebuild it with generate_allowlist.py")
+                    return None
+            except OSError:
+                pass  # no CSV on the device; the blob is the only source
+            f.seek(_BIN_HEADER_SIZE)
+            for _ in range(count):
+                # A short read would leave the previous record in buf.
+                if f.readinto(buf) != _BIN_RECORD_SIZE:
+                    print("Allowlist.bin is truncated")
+                    return None
+                pin, a, b, name = struct.unpack_from(_BIN_RECORD, buf, 0)
+                students[pin] = (
+                    None if a == _BIN_NO_BLOCK else a,
+                    None if b == _BIN_NO_BLOCK else b,
+                    name.rstrip(b"\0").decode("utf-8"),
+                )
+    except OSError:
         return None
+    return students
+
+
+def load_allowlist(
+    *,
+    filename: str = "Allowlist.csv",
+    id_column: str = "STUDENT_PIN",
+    int_columns=("A", "B"),
+):
+    """Parse the whole allowlist once and return ``{student_id: row_dict}``.
+
+    Values in ``int_columns`` are converted to ``int`` (``None`` if blank or
+    malformed) so callers do not re-parse them per lookup. Returns an empty
+    dict if the file cannot be read or has no ``id_column`` header.
+    """
+
+    students = {}
+    try:
+        with open(filename, "r") as f:
+            header = _split_line(f.readline())
+            if id_column not in header:
+                print("Allowlist has no", id_column, "column")
+                return students
+            id_idx = header.index(id_column)
+
+            for raw in f:
+                row = _split_line(raw)
+                if id_idx >= len(row) or not row[id_idx]:
+                    continue
+                # Keep the first row for a duplicated ID, matching lookup_student.
+                if row[id_idx] in students:
+                    continue
+                entry = _make_row(header, row)
+                for name in int_columns:
+                    if name in entry:
+                        entry[name] = _to_int(entry[name])
+                students[row[id_idx]] = entry
+    except OSError as err:
+        print("Allowlist read failed:", err)
+    return students
+
 
-    if not lines:
+def _to_int(val):
+    try:
+        return int(val)
+    except (TypeError, ValueError):
         return None
 
-    header = _split_line(lines[0])
-    use_header = False
-    id_idx = 0
-
-    # Detect header presence by column name.
-    if id_column in header:
-        use_header = True
-        id_idx = header.index(id_column)
-        data_lines = lines[1:]
-    else:
-        data_lines = lines  # treat first line as data
-
-    for raw in data_lines:
-        row = _split_line(raw)
-        if _row_matches(row, sid, id_idx):
-            if use_header:
-                padded = row + [""] * (len(header) - len(row))
-                return dict(zip(header, padded))
-            return tuple(row)
 
-    return None
+def _file_crc32(filename: str, buf) -> int:
+    # Checksum the file in buf-sized chunks so it is never held in memory.
+    crc = 0
+    with open(filename, "rb") as f:
+        while True:
+            n = f.readinto(buf)
+            if not n:
+                break
+            crc = binascii.crc32(memoryview(buf)[:n], crc)
+    return crc & 0xFFFFFFFF
+
+
+def _make_row(header, row):
+    if header is not None:
+        padded = row + [""] * (len(header) - len(row))
+        return dict(zip(header, padded))
+    return tuple(row)
 
 
 def _split_line(line: str):
@@ -57,8 +171,13 @@ def _split_line(line: str):
     return [part.strip() for part in line.split(",")]
 
 
+def _split_line_fast(line: str):
+    # Unstripped split for the scan loop; see _row_matches.
+    return line.split(",")
+
+
 def _row_matches(row, student_id, idx):
     try:
-        return row[idx] == student_id
+        return row[idx].strip() == student_id
     except IndexError:
         return False
@@ -0,0 +1,60 @@
+"""Precompile the firmware modules to ``.mpy`` bytecode with ``mpy-cross``.
+
+CircuitPython imports ``foo.mpy`` without tokenizing or compiling it, which
+shortens boot. ``code.py`` is always run from source, so it is only a shim
+that imports ``main``; everything else is compiled. Use the ``mpy-cross``
+release that matches the board's CircuitPython version (see
+``boot_out.txt``).
+
+    python build_mpy.py                      # writes build/*.mpy
+    python build_mpy.py --deploy /media/CIRCUITPY
+"""
+
+import argparse
+import os
+import shutil
+import subprocess
+
+MODULES = ["allowlist_reader.py", "config.py", "main.py", "rgb1602.py"]
+# Copied as-is next to the compiled modules when deploying.
+SOURCES = ["code.py", "Allowlist.csv", "Allowlist.bin"]
+
+
+def build(out_dir, mpy_cross="mpy-cross"):
+    """Compile each of ``MODULES`` into ``out_dir``; return the output paths."""
+    os.makedirs(out_dir, exist_ok=True)
+    outputs = []
+    for module in MODULES:
+        target = os.path.join(out_dir, os.path.splitext(module)[0] + ".mpy")
+        subprocess.run([mpy_cross, module, "-o", target], check=True)
+        outputs.append(target)
+    return outputs
+
+
+def deploy(outputs, drive):
+    """Copy compiled modules and the runtime sources onto the CIRCUITPY drive."""
+    for path in outputs:
+        shutil.copy(path, drive)
+        # A stale .py next to the .mpy would be imported instead of it.
+        stale = os.path.join(drive, os.path.splitext(os.path.basename(path))[0] + ".py")
+        if os.path.exists(stale):
+            os.remove(stale)
+    for path in SOURCES:
+        if os.path.exists(path):
+            shutil.copy(path, drive)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--out", default="build", help="output directory for .mpy files")
+    parser.add_argument("--mpy-cross", default="mpy-cross", help="mpy-cross executable")
+    parser.add_argument("--deploy", metavar="DRIVE", help="copy the build onto a mounted CIRCUITPY drive")
+    args = parser.parse_args()
+
+    outputs = build(args.out, args.mpy_cross)
+    if args.deploy:
+        deploy(outputs, args.deploy)
+
+
+if __name__ == "__main__":
+    main()
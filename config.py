@@ -0,0 +1,64 @@
+"""Pin assignments and key map for the return keypad.
+
+Kept out of ``main.py`` so the hardware layout lives in one place and can be
+shipped precompiled as ``config.mpy``.
+"""
+import board
+import keypad
+
+esp32s3_project_pins = {
+    "NEOPIXEL": board.A0,      # GPIO18
+    "COL0": board.A5,          # GPIO8
+    "COL1": board.A4,          # GPIO14
+    "COL2": board.A3,          # GPIO15
+    "COL3": board.A2,          # GPIO16
+    "ROW0": board.D13,         # GPIO13
+    "ROW1": board.D12,         # GPIO12
+    "ROW2": board.D11,         # GPIO11
+    "ROW3": board.D10,         # GPIO10
+    "ROW4": board.D9,          # GPIO9
+    "I2C_SDA": board.SDA,      # GPIO3
+    "I2C_SCL": board.SCL,      # GPIO4
+}
+
+# Asterisk key is row 0 / col 1 in this matrix; diodes are row->column.
+ASTERISK_ROW_PIN = esp32s3_project_pins["ROW0"]
+ASTERISK_COL_PIN = esp32s3_project_pins["COL1"]
+
+
+# Key Number to Physical Key Mapping
+KEY_LABELS = {
+    0: "Num Lock",
+    1: "*",
+    2: "-",
+    3: "/",
+    4: "7",
+    5: "8",
+    6: "9",
+    7: "+",
+    8: "4",
+    9: "5",
+    10: "6",
+    12: "1",
+    13: "2",
+    14: "3",
+    15: "Enter",
+    16: "0",
+    18: ".",
+}
+
+# Key numbers resolved once so key dispatch is integer compares only.
+DIGIT_CHAR = {k: v for k, v in KEY_LABELS.items() if v.isdigit()}
+KEY_BACK = 0       # Num Lock
+KEY_SETTINGS = 1   # *
+KEY_UP = 5         # 8
+KEY_DOWN = 13      # 2
+KEY_ENTER = 15
+
+ROWS = [esp32s3_project_pins[f"ROW{i}"] for i in range(5)]
+COLS = [esp32s3_project_pins[f"COL{i}"] for i in range(4)]
+
+
+def make_keyboard():
+    """Return a scanning :class:`keypad.KeyMatrix` for the keypad matrix."""
+    return keypad.KeyMatrix(ROWS, COLS)
@@ -1,9 +1,24 @@
+import argparse
+import binascii
 import csv
 import random
+import struct
 
 PIN_COUNT = 200
 PIN_PREFIX = 1  # first digit must be 1
 PIN_LENGTH = 5
+# Column names shared with allowlist_reader's defaults.
+ID_COLUMN = "STUDENT_PIN"
+NAME_COLUMN = "STUDENT_NAME"
+
+# Binary allowlist layout: a ">IH" header (CRC-32 of the CSV bytes, record
+# count), then one fixed-width ">IBB16s" record (PIN, A, B, NUL-padded UTF-8
+# name) per student, sorted by PIN. BIN_NO_BLOCK marks a blank or malformed
+# A/B value.
+BIN_HEADER = ">IH"
+BIN_RECORD = ">IBB16s"
+BIN_NAME_SIZE = 16
+BIN_NO_BLOCK = 0xFF
 
 
 def generate_pins(count):
@@ -14,13 +29,78 @@ def generate_pins(count):
     return random.sample(list(population), count)
 
 
+def _block_byte(value):
+    try:
+        block = int(value)
+    except (TypeError, ValueError):
+        return BIN_NO_BLOCK
+    return block if 0 <= block < BIN_NO_BLOCK else BIN_NO_BLOCK
+
+
+def _name_bytes(name):
+    # Truncate to the field width without splitting a multi-byte character.
+    return name.encode("utf-8")[:BIN_NAME_SIZE].decode("utf-8", "ignore").encode("utf-8")
+
+
+def _file_crc32(path):
+    with open(path, "rb") as f:
+        return binascii.crc32(f.read()) & 0xFFFFFFFF
+
+
+def build_bin(
+    csv_path="Allowlist.csv",
+    bin_path="Allowlist.bin",
+    id_column=ID_COLUMN,
+    name_column=NAME_COLUMN,
+):
+    """Compile the CSV into the fixed-width blob read by ``load_allowlist_bin``.
+
+    Rerun this whenever the CSV is edited; the firmware ignores a blob whose
+    recorded CRC-32 no longer matches the CSV. Raises ``ValueError`` if the
+    CSV has no ``id_column`` header, rather than writing an empty blob.
+    """
+    records = {}
+    with open(csv_path, newline="", encoding="utf-8") as f:
+        reader = csv.DictReader(f)
+        if id_column not in (reader.fieldnames or ()):
+            raise ValueError("%s has no %s column" % (csv_path, id_column))
+        for row in reader:
+            pin = (row.get(id_column) or "").strip()
+            if not pin.isdigit() or int(pin) in records:
+                continue
+            records[int(pin)] = (
+                _block_byte(row.get("A")),
+                _block_byte(row.get("B")),
+                _name_bytes((row.get(name_column) or "").strip()),
+            )
+
+    with open(bin_path, "wb") as f:
+        f.write(struct.pack(BIN_HEADER, _file_crc32(csv_path), len(records)))
+        for pin in sorted(records):
+            a, b, name = records[pin]
+            f.write(struct.pack(BIN_RECORD, pin, a, b, name))
+
+
 def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--bin-only",
+        action="store_true",
+        help="rebuild Allowlist.bin from the existing Allowlist.csv",
+    )
+    args = parser.parse_args()
+
+    if args.bin_only:
+        build_bin()
+        return
+
     pins = generate_pins(PIN_COUNT)
     with open("Allowlist.csv", "w", newline="") as f:
         writer = csv.writer(f)
-        writer.writerow(["PIN", "A", "B", "log"])
+        writer.writerow([ID_COLUMN, NAME_COLUMN, "A", "B", "LOG"])
         for pin in pins:
-            writer.writerow([pin, random.randint(1, 4), random.randint(1, 4), ""])
+            writer.writerow([pin, "", random.randint(1, 4), random.randint(1, 4), ""])
+    build_bin()
 
 
 if __name__ == "__main__":
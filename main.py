@@ -0,0 +1,381 @@
+import board
+import rgb1602
+import allowlist_reader
+import time
+#import adafruit_bus_device
+import adafruit_max1704x
+import alarm
+import digitalio
+from config import (
+    COLS,
+    DIGIT_CHAR,
+    KEY_BACK,
+    KEY_DOWN,
+    KEY_ENTER,
+    KEY_SETTINGS,
+    KEY_UP,
+    ROWS,
+    make_keyboard,
+)
+
+lcd = rgb1602.RGB1602(16, 2)  
+
+monitor = adafruit_max1704x.MAX17048(board.I2C())
+
+BLOCK = 1
+DAYAB = "A"
+DAYTYPE = "Norm"
+BRIGHTNESS = 1
+
+keyboard = make_keyboard()
+
+# Keep polling this long after the last key before light-sleeping, so a PIN
+# typed at normal speed never pays the KeyMatrix teardown/rebuild.
+IDLE_GRACE_SECONDS = 2
+# Timer wake while asleep, so the battery alert is still checked.
+IDLE_CHECK_SECONDS = 5
+# Re-show the low-battery warning at most this often while the alert holds.
+LOW_BATTERY_REPEAT_SECONDS = 60
+
+
+def sleep_until_key(timeout):
+    """Light-sleep until a key is pressed or ``timeout`` seconds pass.
+
+    KeyMatrix owns the matrix pins, so it is released while asleep. Every row
+    is driven low and every column gets a pulled-up PinAlarm, which is the
+    level a pressed key produces during a KeyMatrix scan. A fresh KeyMatrix
+    is installed on wake. Returns ``True`` if a key caused the wake.
+    """
+    global keyboard
+    keyboard.deinit()
+    row_ios = []
+    for pin in ROWS:
+        row_io = digitalio.DigitalInOut(pin)
+        row_io.switch_to_output(value=False)
+        row_ios.append(row_io)
+    alarms = [alarm.pin.PinAlarm(pin=pin, value=False, pull=True) for pin in COLS]
+    alarms.append(alarm.time.TimeAlarm(monotonic_time=time.monotonic() + timeout))
+    woke = alarm.light_sleep_until_alarms(*alarms)
+    for row_io in row_ios:
+        row_io.deinit()
+    keyboard = make_keyboard()
+    return not isinstance(woke, alarm.time.TimeAlarm)
+
+class Menu: 
+    def __init__(self, title, items):
+        self.title = title
+        self.items = items 
+        #items is [(label, action/menu), ...]
+        # Labels padded to the 15 columns left of the cursor marker, built once.
+        self._padded = [label[:15] + " "*(15-len(label[:15])) for label, _ in items]
+    def render(self, lcd, scroll, cursor):
+        # Each row is written full width, so no lcd.clear() is needed.
+        visible = self._padded[scroll:scroll+2]
+        # pad if fewer than two items remain
+        while len(visible) < 2:
+            visible.append(" "*15)
+
+        for row, padded in enumerate(visible):
+            suffix = "<" if row == cursor else " "
+            lcd.write_text(padded + suffix, row=row, clear_line=True)
+    def _redraw_cursor(self, lcd, prev_cursor, cursor):
+        # Cursor moved without scrolling: only the marker column changes.
+        lcd.write_at(15, prev_cursor, " ")
+        lcd.write_at(15, cursor, "<")
+    def activate(self, lcd, keyboard):
+        scroll = 0
+        cursor = 0
+        self.render(lcd, scroll, cursor)
+        events_get = keyboard.events.get
+        while True:
+            event = events_get()
+            if not (event and event.pressed):
+                continue
+            kn = event.key_number
+            if kn == KEY_UP:
+                if cursor > 0:
+                    cursor -= 1
+                    self._redraw_cursor(lcd, cursor + 1, cursor)
+                elif scroll > 0:
+                    scroll -= 1
+                    self.render(lcd, scroll, cursor)
+            elif kn == KEY_DOWN:
+                if cursor < 1 and scroll + cursor + 1 < len(self.items):
+                    cursor += 1
+                    self._redraw_cursor(lcd, cursor - 1, cursor)
+                elif scroll + 2 < len(self.items):
+                    scroll += 1
+                    self.render(lcd, scroll, cursor)
+            elif kn == KEY_ENTER:
+                label, target = self.items[scroll + cursor]
+                if isinstance(target, Menu):
+                    target.activate(lcd, keyboard)
+                    self.render(lcd, scroll, cursor)  # redraw on return
+                elif callable(target):
+                    if target():
+                        break
+                    self.render(lcd, scroll, cursor)
+                else:
+                    return
+            elif kn == KEY_BACK:
+                return
+def bat_state():
+    #monitor.wake()
+    lcd.clear()
+    lcd.write_text("Battery:", row=0)
+    percentage = f"{monitor.cell_percent:.1f} %"
+    lcd.write_text(percentage, row=1, clear_line=True)
+    #monitor.hibernate()
+    _show_for(2, _show_entry_screen)
+    return(True)
+
+
+def upload_allowlist():
+    return(True)
+
+def brightness_set():
+    return(True)
+
+def set_block():
+    global BLOCK
+    input_block = ""
+    lcd.clear()
+    lcd.write_text("What block?", row=0)
+    events_get = keyboard.events.get
+    lcd_write = lcd.write_text
+    digit_char_get = DIGIT_CHAR.get
+    while 1:
+        event = events_get()
+        if event and event.pressed:
+            kn = event.key_number
+            key = digit_char_get(kn)
+            if key is not None:
+                if "1" <= key <= "4" and not input_block:
+                    input_block = key
+                    lcd_write(input_block, row=1, clear_line=True)
+            elif kn == KEY_BACK:
+                input_block = ""
+                lcd_write(input_block, row=1, clear_line=True)
+            elif kn == KEY_ENTER:
+                if input_block:
+                    BLOCK = int(input_block)
+                    return(True)
+
+def set_a_or_b_day(output):
+    global DAYAB
+    DAYAB = output
+    return(True) 
+
+def set_day_type(output):
+    global DAYTYPE
+    DAYTYPE = output
+    return(True)
+
+day_type_menu = Menu("Day Type?", [
+    ("Regular Day", lambda: set_day_type("Norm")),
+    ("Assembly", lambda: set_day_type("Assy")),
+    ("Wednesday", lambda: set_day_type("Weds"))
+])
+
+def _set_day(ab):
+    set_a_or_b_day(ab)
+    day_type_menu.activate(lcd, keyboard)
+    return(True)
+
+a_or_b_day_menu = Menu("A or B Day?", [
+    ("A Day", lambda: _set_day("A")),
+    ("B Day", lambda: _set_day("B"))
+])
+
+
+def go_deep_sleep():
+    monitor.hibernate()
+    lcd.clear()
+    lcd.setRGB(0,0,0)
+    raise SystemExit
+
+
+
+settings = Menu("Settings", [
+    ("Set day", a_or_b_day_menu),
+    ("Set block", set_block),
+    ("Upload Allowlist", upload_allowlist),
+    ("Battery State", bat_state),
+    ("Power off", go_deep_sleep),
+])
+
+# Status line currently on row 1; None whenever something else overwrote it.
+_last_status = None
+
+
+def _draw_status():
+    """Show the day/block status on row 1, skipping the write if unchanged."""
+    global _last_status
+    status = f"{DAYAB} Day, Block {BLOCK}"
+    if status != _last_status:
+        lcd.write_text(status, row=1, clear_line=True)
+        _last_status = status
+
+
+# While a result or alert screen is up: when to take it down, and how.
+_result_deadline = None
+_result_reset = None
+
+
+def _show_for(seconds, reset):
+    """Keep the current screen up for ``seconds`` without blocking the loop.
+
+    The main loop calls ``reset`` once the time is up, or straight away if a
+    key is pressed first.
+    """
+    global _result_deadline, _result_reset
+    _result_deadline = time.monotonic() + seconds
+    _result_reset = reset
+
+
+def _end_result():
+    global _result_deadline, _result_reset
+    reset = _result_reset
+    _result_deadline = None
+    _result_reset = None
+    reset()
+
+
+def _show_entry_screen():
+    lcd.setRGB(255*BRIGHTNESS, 255*BRIGHTNESS, 255*BRIGHTNESS)
+    # Digit presses only write their own column, so put back any digits
+    # typed before this screen was covered.
+    typed = bytes(pin_digits[:pin_len]).decode()
+    lcd.write_text(input_prefix + typed, row=0, clear_line=True)
+    _draw_status()
+
+
+def _block_mask(first_block):
+    """Return a mask with bit ``n`` set for every block ``n >= first_block``."""
+    if first_block is None:
+        return 0
+    return sum(1 << b for b in range(max(first_block, 0), 5))
+
+
+def get_student_info(stid):
+    global _last_status
+    entry = ALLOWLIST.get(int(stid))
+    if entry is None:
+        # Row 1 keeps the status line, so restoring the entry screen skips it.
+        lcd.write_text("ID not found", row=0, clear_line=True)
+        lcd.setRGB(255, 0, 0)
+        _show_for(1, _show_entry_screen)
+        return
+
+    a_mask, b_mask, label = entry
+    _last_status = None  # the result replaces the status on row 1
+    mask = a_mask if DAYAB == "A" else b_mask
+    if (mask >> BLOCK) & 1:
+        lcd.write_text(f"{label}", row=0, clear_line=True)
+        lcd.write_text(f"OK - {DAYAB} DAY, P{BLOCK}", row=1, clear_line=True)
+        lcd.setRGB(0, 255, 0)
+    else:
+        lcd.write_text(label, row=0, clear_line=True)
+        lcd.write_text(f"Not Allowed-{DAYAB},P{BLOCK}", row=1, clear_line=True)
+        lcd.setRGB(255, 0, 0)
+    _show_for(2, _show_entry_screen)
+
+
+lcd.write_text("Booting...", row=0, clear_line=True)
+# Load the allowlist once into {pin: (a_mask, b_mask, label)} with int PINs;
+# each Enter press is then a dict lookup and a bit test. The compiled
+# Allowlist.bin needs no text parsing; the CSV is the fallback when the blob
+# is missing, stale or empty.
+_students = allowlist_reader.load_allowlist_bin()
+if _students:
+    ALLOWLIST = {
+        pin: (_block_mask(a), _block_mask(b), name or str(pin))
+        for pin, (a, b, name) in _students.items()
+    }
+else:
+    ALLOWLIST = {
+        int(pin): (_block_mask(row.get("A")), _block_mask(row.get("B")), row.get("STUDENT_NAME") or pin)
+        for pin, row in allowlist_reader.load_allowlist().items()
+        if pin.isdigit()
+    }
+del _students
+time.sleep(.5)
+lcd.clear()
+
+# Fixed-size ASCII buffer for the PIN being typed; pin_len digits are valid.
+PIN_LENGTH = 5
+pin_digits = bytearray(PIN_LENGTH)
+pin_len = 0
+input_prefix = "Student ID:"
+pin_col = len(input_prefix)
+_show_entry_screen()
+# Bound once so the loop skips the attribute lookups on every pass.
+events_get = keyboard.events.get
+lcd_write_at = lcd.write_at
+digit_char_get = DIGIT_CHAR.get
+monotonic = time.monotonic
+last_key_time = monotonic()
+next_battery_alert = 0
+while True:
+    if _result_deadline is not None and monotonic() >= _result_deadline:
+        _end_result()
+
+    if (
+        _result_deadline is None
+        and monotonic() >= next_battery_alert
+        and monitor.active_alert
+    ):
+        if monitor.SOC_low_alert:
+            lcd.clear()
+            _last_status = None
+            lcd.write_text("LOW BATTERY", row=0, clear_line=True)
+            lcd.setRGB(255, 0, 0)
+            _show_for(2, _show_entry_screen)
+            next_battery_alert = monotonic() + LOW_BATTERY_REPEAT_SECONDS
+
+    event = events_get()
+    if not event:
+        # A latched battery alert does not keep the loop awake: the TimeAlarm
+        # wakes it every IDLE_CHECK_SECONDS, which is enough for the repeat.
+        if (
+            _result_deadline is not None
+            or monotonic() - last_key_time < IDLE_GRACE_SECONDS
+        ):
+            time.sleep(0.05)  # brief idle to avoid a tight polling loop
+        else:
+            woke_by_key = sleep_until_key(IDLE_CHECK_SECONDS)
+            events_get = keyboard.events.get  # a new KeyMatrix was installed
+            if woke_by_key:
+                # Give the new KeyMatrix time to scan the key that woke us.
+                last_key_time = monotonic()
+        continue
+    last_key_time = monotonic()
+    if event: 
+        if event.pressed:
+            if _result_deadline is not None:
+                _end_result()  # a keypress dismisses the result early
+            kn = event.key_number
+            key = digit_char_get(kn)
+            if key is not None:
+                if pin_len < PIN_LENGTH:
+                    pin_digits[pin_len] = ord(key)
+                    # Only the new digit changed; leave the rest of the row alone.
+                    lcd_write_at(pin_col + pin_len, 0, key)
+                    pin_len += 1
+            elif kn == KEY_ENTER:
+                if pin_len == PIN_LENGTH:
+                    student_id = bytes(pin_digits).decode()
+                    pin_len = 0
+                    # Both result screens write row 0 full width, so no clear.
+                    get_student_info(student_id)  # restores the entry screen later
+
+            elif kn == KEY_BACK:
+                if pin_len:
+                    pin_len -= 1
+                    lcd_write_at(pin_col + pin_len, 0, " ")
+            elif kn == KEY_SETTINGS:
+                settings.activate(lcd, keyboard)
+                _last_status = None  # the menu used row 1
+                pin_len = 0
+                if _result_deadline is None:
+                    _show_entry_screen()
@@ -31,6 +31,10 @@ REG_MODE1 = 0x00
 REG_MODE2 = 0x01
 REG_OUTPUT = 0x08
 
+# PCA9633 control-byte flags (AI2|AI0): auto-increment over the brightness
+# registers only, so one write starting at REG_BLUE sets blue, green and red.
+RGB_AUTO_INCREMENT_PWM = 0xA0
+
 LCD_CLEARDISPLAY = 0x01
 LCD_RETURNHOME = 0x02
 LCD_ENTRYMODESET = 0x04
@@ -98,6 +102,14 @@ class RGB1602:
         self._lcd = I2CDevice(self._i2c, LCD_ADDRESS)
         self._rgb = I2CDevice(self._i2c, RGB_ADDRESS)
 
+        # Reused I2C write buffers so hot paths do not allocate per call.
+        self._lcd_buf = bytearray(2)
+        self._rgb_buf = bytearray(2)
+        self._color_buf = bytearray(4)
+        self._color_buf[0] = RGB_AUTO_INCREMENT_PWM | REG_BLUE
+        self._line_buf = bytearray(col + 1)
+        self._line_buf[0] = 0x40
+
         self._showfunction = LCD_4BITMODE | LCD_1LINE | LCD_5x8DOTS
         self._showcontrol = LCD_DISPLAYON | LCD_CURSOROFF | LCD_BLINKOFF
         self._showmode = LCD_ENTRYLEFT | LCD_ENTRYSHIFTDECREMENT
@@ -105,8 +117,11 @@ class RGB1602:
         self.begin(self._row, self._col)
 
     def _write_lcd(self, control: int, data: int) -> None:
+        buf = self._lcd_buf
+        buf[0] = control
+        buf[1] = data & 0xFF
         with self._lcd as lcd:
-            lcd.write(bytes([control, data & 0xFF]))
+            lcd.write(buf)
 
     def command(self, cmd: int) -> None:
         self._write_lcd(0x80, cmd)
@@ -115,16 +130,48 @@ class RGB1602:
         self._write_lcd(0x40, data)
 
     def _set_reg(self, reg: int, data: int) -> None:
+        buf = self._rgb_buf
+        buf[0] = reg & 0xFF
+        buf[1] = data & 0xFF
         with self._rgb as rgb:
-            rgb.write(bytes([reg & 0xFF, data & 0xFF]))
+            rgb.write(buf)
 
     def setRGB(self, r: int, g: int, b: int) -> None:
         """Set backlight color using raw 0-255 RGB values."""
 
+        if self._rgb_auto_increment:
+            buf = self._color_buf
+            buf[1] = b & 0xFF
+            buf[2] = g & 0xFF
+            buf[3] = r & 0xFF
+            with self._rgb as rgb:
+                rgb.write(buf)
+            return
         self._set_reg(REG_RED, r)
         self._set_reg(REG_GREEN, g)
         self._set_reg(REG_BLUE, b)
 
+    def _probe_rgb_auto_increment(self) -> bool:
+        """Return ``True`` if the backlight chip honours auto-increment writes.
+
+        Writes three PWM values in one transaction and reads each register
+        back individually; any mismatch or bus error keeps the per-register
+        path.
+        """
+
+        expected = ((REG_BLUE, 0x11), (REG_GREEN, 0x22), (REG_RED, 0x33))
+        readback = bytearray(1)
+        try:
+            with self._rgb as rgb:
+                rgb.write(bytes([RGB_AUTO_INCREMENT_PWM | REG_BLUE, 0x11, 0x22, 0x33]))
+                for reg, value in expected:
+                    rgb.write_then_readinto(bytes([reg]), readback)
+                    if readback[0] != value:
+                        return False
+        except OSError:
+            return False
+        return True
+
     def set_backlight(self, r: int, g: int, b: int) -> None:
         """User-friendly alias for :meth:`setRGB`."""
 
@@ -138,8 +185,7 @@ class RGB1602:
             col |= 0x80
         else:
             col |= 0xC0
-        with self._lcd as lcd:
-            lcd.write(bytes([0x80, col]))
+        self._write_lcd(0x80, col)
 
     def clear(self) -> None:
         """Clear the display and reset the cursor position."""
@@ -155,11 +201,34 @@ class RGB1602:
         sleep(0.002)
 
     def printout(self, arg) -> None:  # noqa: ANN001 - keep compatibility
-        """Write the raw string representation starting at the current cursor."""
+        """Write the raw string representation starting at the current cursor.
 
-        text = str(arg)
-        for byte in text.encode("utf-8"):
-            self.write(byte)
+        One 0x40 control byte (Co=0, RS=1) is followed by every data byte, so
+        the whole string is a single I2C transaction; DDRAM auto-increments.
+        """
+
+        data = str(arg).encode("utf-8")
+        end = len(data) + 1
+        if end == 1:
+            return
+        buf = self._line_buf
+        if len(buf) < end:
+            # Longer than a row; grow the reused buffer once.
+            buf = self._line_buf = bytearray(end)
+            buf[0] = 0x40
+        buf[1:end] = data
+        with self._lcd as lcd:
+            lcd.write(buf, end=end)
+
+    def write_at(self, col: int, row: int, text: str) -> None:
+        """Write ``text`` at ``col``/``row`` without clearing or padding.
+
+        This is the cheap path for small in-place updates such as a single
+        digit: one cursor command plus one data transaction.
+        """
+
+        self.setCursor(col, row)
+        self.printout(text)
 
     def write_text(
         self,
@@ -185,13 +254,14 @@ class RGB1602:
         if col is not None or row is not None:
             self.setCursor(col or 0, row or 0)
 
-        self.printout(text)
-
         if clear_line and row is not None:
-            # Pad with spaces to erase the rest of the line.
+            # Pad with spaces to erase the rest of the line, sent together with
+            # the text as one data transaction.
             remaining = max(self._col - (col or 0) - len(text), 0)
             if remaining:
-                self.printout(" " * remaining)
+                text = text + " " * remaining
+
+        self.printout(text)
 
     def display(self) -> None:
         """Turn the display on."""
@@ -257,6 +327,7 @@ class RGB1602:
         self._set_reg(REG_MODE1, 0)
         self._set_reg(REG_OUTPUT, 0xFF)
         self._set_reg(REG_MODE2, 0x20)
+        self._rgb_auto_increment = self._probe_rgb_auto_increment()
         self.setColorWhite()
 
     def setColorWhite(self) -> None: